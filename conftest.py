@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2021-2023 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+# pylint: skip-file
+# mypy: ignore-errors
+# flake8: noqa
+
+"""Conftest module for the whole repository."""
+
+import os
+from typing import List
+
+import pytest
+from aea_test_autonomy.docker.base import DockerBaseTest
+
+
+# the name of the pytest-xdist worker running the tests, e.g. "gw0", unset when the tests are not distributed
+XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER")
+
+# the xdist group of the tests that start docker containers
+DOCKER_GROUP = "docker"
+
+# the markers of the tests that start docker containers through fixtures
+DOCKER_MARKERS = ("integration", "e2e")
+
+
+def uses_docker(item: pytest.Item) -> bool:
+    """Check whether the test starts docker containers."""
+    cls = getattr(item, "cls", None)  # only the python test functions belong to a class
+    if cls is not None and issubclass(cls, DockerBaseTest):
+        return True
+    return any(item.get_closest_marker(marker) is not None for marker in DOCKER_MARKERS)
+
+
+@pytest.hookimpl(tryfirst=True)  # before xdist reads the groups on the workers
+def pytest_collection_modifyitems(items: List[pytest.Item]) -> None:
+    """
+    Assign the tests to the xdist groups used by `--dist loadgroup`.
+
+    The docker images bind the same host ports (e.g. Ganache and HardHat on 8545), and every test class stops
+    the containers of its image that are already running, so all the tests that use docker share one worker.
+    Every other test file is a group of its own, so that its module and class fixtures are set up only once.
+
+    :param items: the collected tests.
+    """
+    if XDIST_WORKER is None:
+        return
+
+    for item in items:
+        group = DOCKER_GROUP if uses_docker(item) else item.nodeid.split("::")[0]
+        item.add_marker(pytest.mark.xdist_group(name=group))
@@ -33,6 +33,7 @@ TEST_DATA_DIR = PACKAGE_DIR / "tests" / "data"
 DEFAULT_ASYNC_TIMEOUT = 5.0
 DEFAULT_REQUESTS_TIMEOUT = 5.0
 MAX_RETRIES = 30
+DEFAULT_GAS = 1000000000  # gas limit of the txs sent by the contract tests
 LOCALHOST = "localhost"
 HTTP_LOCALHOST = f"http://{LOCALHOST}"
 WEI_TO_ETH = 10 ** 18
@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2021-2023 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+# pylint: skip-file
+# mypy: ignore-errors
+# flake8: noqa
+
+"""Helpers for the contract tests."""
+
+import functools
+import os
+import time
+from typing import Any, Dict, List, Sequence, Tuple
+
+import requests
+from aea.crypto.registries import crypto_registry
+from aea_ledger_ethereum import EthereumApi, EthereumCrypto
+from requests.adapters import HTTPAdapter
+from web3 import Web3
+from web3.contract import Contract
+from web3.exceptions import TransactionNotFound
+from web3.types import TxReceipt
+
+
+RECEIPT_POLL_LATENCY = float(os.environ.get("CONTRACT_TESTS_RECEIPT_POLL_LATENCY", 0.1))
+RECEIPT_TIMEOUT = 5.0
+# the connections kept alive to the test node, one per thread that may send requests at the same time
+SESSION_POOL_MAXSIZE = 4
+
+
+def _make_session() -> requests.Session:
+    """Make an http session that keeps its connections to the node alive between requests."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_maxsize=SESSION_POOL_MAXSIZE, max_retries=0)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+_SESSION = _make_session()
+
+
+@functools.lru_cache(maxsize=None)
+def get_crypto(private_key_path: str) -> EthereumCrypto:
+    """Get the crypto object of a private key, loading the key file and deriving the account only once."""
+    return crypto_registry.make(
+        EthereumCrypto.identifier, private_key_path=private_key_path
+    )
+
+
+def wait_for_receipt(
+    ledger_api: EthereumApi,
+    tx_hash: str,
+    timeout: float = RECEIPT_TIMEOUT,
+    poll_latency: float = RECEIPT_POLL_LATENCY,
+) -> TxReceipt:
+    """
+    Wait for a transaction to be mined and return its receipt.
+
+    The receipt is polled every `poll_latency` seconds, which can be tuned through the
+    `CONTRACT_TESTS_RECEIPT_POLL_LATENCY` environment variable.
+
+    :param ledger_api: the ledger api.
+    :param tx_hash: the hash of the transaction.
+    :param timeout: the seconds to wait for the transaction to be mined.
+    :param poll_latency: the seconds to wait between two polls.
+    :return: the receipt of the transaction.
+    """
+    (receipt,) = wait_for_receipts(ledger_api, [tx_hash], timeout, poll_latency)
+    return receipt
+
+
+def wait_for_receipts(
+    ledger_api: EthereumApi,
+    tx_hashes: Sequence[str],
+    timeout: float = RECEIPT_TIMEOUT,
+    poll_latency: float = RECEIPT_POLL_LATENCY,
+) -> List[TxReceipt]:
+    """Wait for several transactions to be mined, polling all the pending ones in each round, and return their receipts in order."""
+    receipts: Dict[str, TxReceipt] = {}
+    deadline = time.time() + timeout
+    while True:
+        for tx_hash in tx_hashes:
+            if tx_hash in receipts:
+                continue
+            try:
+                receipts[tx_hash] = ledger_api.api.eth.get_transaction_receipt(tx_hash)
+            except TransactionNotFound:
+                continue
+        if len(receipts) == len(set(tx_hashes)):
+            return [receipts[tx_hash] for tx_hash in tx_hashes]
+        if time.time() >= deadline:
+            pending = [tx_hash for tx_hash in tx_hashes if tx_hash not in receipts]
+            raise TimeoutError(
+                f"Transactions {pending} were not mined within {timeout} seconds."
+            )
+        time.sleep(poll_latency)
+
+
+def batch_call(
+    ledger_api: EthereumApi,
+    contract: Contract,
+    calls: Sequence[Tuple[str, List[Any]]],
+) -> List[Any]:
+    """
+    Perform several read-only contract calls in a single JSON-RPC batch request.
+
+    All the calls are evaluated against the same block, at the cost of one round trip to the node.
+
+    :param ledger_api: the ledger api.
+    :param contract: the web3 contract instance.
+    :param calls: the function names and arguments of the calls.
+    :return: the decoded return value of each call, in order.
+    :raises ValueError: if any of the calls fails, e.g. because it reverts.
+    """
+    payload = [
+        {
+            "jsonrpc": "2.0",
+            "id": i,
+            "method": "eth_call",
+            "params": [
+                {
+                    "to": contract.address,
+                    "data": contract.encodeABI(fn_name=fn_name, args=args),
+                },
+                "latest",
+            ],
+        }
+        for i, (fn_name, args) in enumerate(calls)
+    ]
+    response = _SESSION.post(
+        ledger_api.api.provider.endpoint_uri, json=payload, timeout=10
+    )
+    response.raise_for_status()
+    responses = {item["id"]: item for item in response.json()}
+
+    values = []
+    for i, (fn_name, _) in enumerate(calls):
+        if "error" in responses[i]:
+            raise ValueError(
+                f"The call to {fn_name} failed: {responses[i]['error'].get('message')}"
+            )
+        result = responses[i]["result"]
+        output_types = [
+            output["type"]
+            for output in contract.get_function_by_name(fn_name).abi["outputs"]
+        ]
+        decoded = ledger_api.api.codec.decode(output_types, bytes.fromhex(result[2:]))
+        decoded = [
+            Web3.to_checksum_address(value) if type_ == "address" else value
+            for type_, value in zip(output_types, decoded)
+        ]
+        values.append(decoded[0] if len(decoded) == 1 else tuple(decoded))
+    return values
@@ -22,8 +22,11 @@
 
 """End2end tests base classes for this repo."""
 import json
+import logging
 import subprocess  # nosec
 import threading
+import time
+from typing import List, Tuple
 
 import web3
 from aea.configurations.base import PublicId
@@ -85,6 +88,8 @@ from packages.valory.skills.abstract_round_abci.models import MIN_RESET_PAUSE_DU
 ONE_ETH = 10 ** 18
 TERMINATION_TIMEOUT = 120
 
+_logger = logging.getLogger(__name__)
+
 
 class BaseTestElCollectooorrEnd2End(BaseTestEnd2End):
     """
@@ -104,6 +109,8 @@ class BaseTestElCollectooorrEnd2End(BaseTestEnd2End):
     ELCOL_NET_HOST = _DEFAULT_ELCOL_NET_HOST
     ELCOL_NET_CHAIN_ID = _DEFAULT_ELCOL_NET_CHAIN_ID
     MULTICALL2_ADDRESS = _DEFAULT_MULTICALL2_ADDRESS
+    # seconds between two scans of the agents' output for the check strings and the happy path
+    poll_interval: float = 0.5
 
     __args_prefix = f"vendor.elcollectooorr.skills.{PublicId.from_str(skill_package).name}.models.params.args"
     extra_configs = [
@@ -162,6 +169,95 @@ class BaseTestElCollectooorrEnd2End(BaseTestEnd2End):
         self.check_aea_messages()
         self.terminate_agents(timeout=TERMINATION_TIMEOUT)
 
+    def check_aea_messages(self) -> None:
+        """
+        Check that *each* AEA prints these messages.
+
+        First failing check will cause assertion error and test tear down.
+        `wait_to_finish` is a single deadline shared by all the agents, the check returns as soon as
+        every agent has printed its messages, so that the agents can be terminated right away.
+        """
+        deadline = time.time() + self.wait_to_finish
+        for i, process in self.processes.items():
+            if i in self.exclude_from_checks:
+                continue
+            missing_strict_strings = self._missing_strict_strings(
+                process,
+                max(deadline - time.time(), 0),
+                self.poll_interval,
+            )
+            missing_round_strings: List[str] = []
+            if self.happy_path:
+                # the round strings are only counted while the timeout has not expired,
+                # so at least one polling period is given to count them once past the deadline
+                _, missing_round_strings = self.missing_from_output(
+                    process=process,
+                    happy_path=self.happy_path,
+                    timeout=max(deadline - time.time(), self.poll_interval),
+                    period=self.poll_interval,
+                )
+            self._BaseTestEnd2End__check_missing_strings(  # type: ignore
+                missing_strict_strings, missing_round_strings, i
+            )
+
+    @classmethod
+    def _get_strict_check_scan_data(cls) -> Tuple[Tuple[str, ...], int]:
+        """
+        Get the deduplicated strict check strings and the overlap window of the log scan.
+
+        They are built on first use and cached on the test class, so that no work is done at collection time.
+
+        :return: the strict check strings and the overlap window.
+        """
+        if "_strict_check_scan_data" not in cls.__dict__:
+            strings = tuple(dict.fromkeys(cls.strict_check_strings))
+            overlap = max(map(len, strings), default=1) - 1
+            cls._strict_check_scan_data = (strings, overlap)
+        return cls._strict_check_scan_data
+
+    @classmethod
+    def _missing_strict_strings(
+        cls,
+        process: subprocess.Popen,
+        timeout: float,
+        period: float = 1,
+    ) -> List[str]:
+        """
+        Scan the process output for the strict check strings until all of them appear or the timeout expires.
+
+        Only the output appended since the previous poll is scanned, overlapped by the length of the
+        longest check string so that matches spanning two polls are not lost. Every log line is therefore
+        inspected once, instead of rescanning the whole output for every check string on every poll.
+
+        :param process: the agent subprocess.
+        :param timeout: the amount of seconds before stopping the check.
+        :param period: the period of checking.
+        :return: the check strings that did not appear in the output.
+        """
+        strict_check_strings, overlap = cls._get_strict_check_scan_data()
+        missing_strings = list(strict_check_strings)
+        scanned = 0
+        end_time = time.time() + timeout
+        while True:
+            output = cls.stdout[process.pid]
+            chunk = output[max(scanned - overlap, 0) :]
+            scanned = len(output)
+            missing_strings = [line for line in missing_strings if line not in chunk]
+            # the output is scanned at least once, even if the timeout has already expired
+            if not missing_strings or time.time() >= end_time:
+                break
+            time.sleep(period)
+
+        if missing_strings:
+            _logger.info(
+                "Non-empty missing strings, stderr:\n%s", cls.stderr[process.pid]
+            )
+            _logger.info(
+                "Non-empty missing strings, stdout:\n%s", cls.stdout[process.pid]
+            )
+
+        return missing_strings
+
     def _BaseTestEnd2End__prepare_agent_i(self, i: int, nb_agents: int) -> None:
         """Prepare the i-th agent."""
         super()._BaseTestEnd2End__prepare_agent_i(i, nb_agents)  # type: ignore
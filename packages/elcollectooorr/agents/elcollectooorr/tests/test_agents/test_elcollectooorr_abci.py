@@ -121,6 +121,7 @@ RESET_STRINGS = (
 )
 
 
+@pytest.mark.e2e
 @pytest.mark.parametrize("nb_nodes", (4,))
 class TestHappyPath(
     BaseTestElCollectooorrEnd2End,
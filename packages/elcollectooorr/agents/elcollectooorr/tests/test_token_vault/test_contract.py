@@ -19,17 +19,23 @@
 # pylint: skip-file
 
 """Tests for valory/token_vault contract."""
-import time
 from typing import Any, Dict, cast
 
-from aea.crypto.registries import crypto_registry
-from aea_ledger_ethereum import EthereumCrypto
 from aea_test_autonomy.base_test_classes.contracts import (
     BaseGanacheContractWithDependencyTest,
 )
 from aea_test_autonomy.configurations import ETHEREUM_KEY_PATH_1
 from aea_test_autonomy.docker.base import skip_docker_tests
+from aea_test_autonomy.helpers.contracts import get_register_contract
 
+from packages.elcollectooorr.agents.elcollectooorr.tests.helpers.constants import (
+    DEFAULT_GAS,
+)
+from packages.elcollectooorr.agents.elcollectooorr.tests.helpers.contracts import (
+    get_crypto,
+    wait_for_receipt,
+    wait_for_receipts,
+)
 from packages.elcollectooorr.contracts.basket.contract import BasketContract
 from packages.elcollectooorr.contracts.basket.tests import PACKAGE_DIR as BASKET_DIR
 from packages.elcollectooorr.contracts.basket_factory.contract import (
@@ -51,17 +57,17 @@ from packages.elcollectooorr.contracts.token_vault_factory.contract import (
 )
 
 
-DEFAULT_GAS = 1000000000
-DEFAULT_MAX_FEE_PER_GAS = 10 ** 10
-DEFAULT_MAX_PRIORITY_FEE_PER_GAS = 10 ** 10
-
-
 @skip_docker_tests
 class TestTokenVault(BaseGanacheContractWithDependencyTest):
     """Test deployment of Token Vault to Ganache."""
 
     contract_directory = TOKEN_VAULT_DIR
     contract: TokenVaultContract
+    settings_address: str
+    basket_address: str
+    basket_contract: BasketContract
+    vault_factory_address: str
+    vault_factory_contract: TokenVaultFactoryContract
 
     dependencies = [
         (
@@ -78,14 +84,6 @@ class TestTokenVault(BaseGanacheContractWithDependencyTest):
                 gas=DEFAULT_GAS,
             ),
         ),
-        (
-            "basket",
-            BASKET_DIR,
-            dict(
-                gas=DEFAULT_GAS,
-                is_basket=True,
-            ),
-        ),
         (
             "token_vault_factory",
             TOKEN_VAULT_FACTORY_DIR,
@@ -100,16 +98,13 @@ class TestTokenVault(BaseGanacheContractWithDependencyTest):
             cls.dependency_info["token_settings"] is not None
         ), "token_settings is not ready"
 
-        basket_address, _ = cls.dependency_info["basket"]
-        vault_factory_address, _ = cls.dependency_info["token_vault_factory"]
-
         return dict(
             is_token_vault=True,
             gas=DEFAULT_GAS,
-            token_vault_factory_address=vault_factory_address,
+            token_vault_factory_address=cls.vault_factory_address,
             name="test_name",
             symbol="TST",
-            token_address=basket_address,
+            token_address=cls.basket_address,
             token_id=0,
             token_supply=3,
             list_price=1,
@@ -117,46 +112,61 @@ class TestTokenVault(BaseGanacheContractWithDependencyTest):
         )
 
     @classmethod
-    def _deploy_basket(cls, **kwargs: Any) -> None:  # pylint: disable=inconsistent-return-statements
-        """Deploy basket"""
+    def _deploy_dependencies(cls) -> None:
+        """Deploy the dependencies, then create the basket through the already deployed basket factory."""
+        super()._deploy_dependencies()
+
+        cls.settings_address, _ = cls.dependency_info["token_settings"]
+        vault_factory_address, vault_factory_contract = cls.dependency_info[
+            "token_vault_factory"
+        ]
+        cls.vault_factory_address = vault_factory_address
+        cls.vault_factory_contract = cast(
+            TokenVaultFactoryContract, vault_factory_contract
+        )
+
+        cls._create_basket(gas=DEFAULT_GAS)
+
+    @classmethod
+    def _create_basket(cls, **kwargs: Any) -> None:
+        """Create a basket using the basket factory"""
 
-        basket_factory_address, _ = cls.dependency_info["basket_factory"]
+        basket_factory_address, basket_factory_contract = cls.dependency_info[
+            "basket_factory"
+        ]
+        basket_factory_contract = cast(BasketFactoryContract, basket_factory_contract)
 
-        tx = cls.contract.get_deploy_transaction(
+        tx = basket_factory_contract.create_basket(
             ledger_api=cls.ledger_api,
+            factory_contract_address=basket_factory_address,
             deployer_address=str(cls.deployer_crypto.address),
-            basket_factory_address=basket_factory_address,
             **kwargs,
         )
-        if tx is None:
-            return None
         tx_signed = cls.deployer_crypto.sign_transaction(tx)
         tx_hash = cls.ledger_api.send_signed_transaction(tx_signed)
 
-        time.sleep(3)  # wait for the transaction to settle
+        wait_for_receipt(cls.ledger_api, tx_hash)
 
         basket_info = cast(
             Dict,
-            BasketFactoryContract.get_basket_address(
+            basket_factory_contract.get_basket_address(
                 cls.ledger_api,
                 basket_factory_address,
                 str(tx_hash),
             ),
         )
-        cls.contract_address = str(basket_info["basket_address"])
+        cls.basket_address = str(basket_info["basket_address"])
+        cls.basket_contract = cast(BasketContract, get_register_contract(BASKET_DIR))
 
     @classmethod
     def _permission_vault_factory(cls) -> None:
         """Permission the vault factory to use the basket"""
 
-        basket_address, basket_contract = cls.dependency_info["basket"]
-        basket_contract = cast(BasketContract, basket_contract)
-        vault_factory_address, _ = cls.dependency_info["token_vault_factory"]
-        raw_tx = basket_contract.set_approve_for_all(
+        raw_tx = cls.basket_contract.set_approve_for_all(
             ledger_api=cls.ledger_api,
-            contract_address=basket_address,
+            contract_address=cls.basket_address,
             sender_address=cls.deployer_crypto.address,
-            operator_address=vault_factory_address,
+            operator_address=cls.vault_factory_address,
             is_approved=True,
             gas=DEFAULT_GAS,
         )
@@ -165,7 +175,7 @@ class TestTokenVault(BaseGanacheContractWithDependencyTest):
         tx_signed = cls.deployer_crypto.sign_transaction(raw_tx)
         tx_hash = cls.ledger_api.send_signed_transaction(tx_signed)
 
-        time.sleep(3)  # wait for the transaction to settle
+        wait_for_receipt(cls.ledger_api, tx_hash)
 
         assert tx_hash is not None, "Tx hash is none"
 
@@ -180,16 +190,13 @@ class TestTokenVault(BaseGanacheContractWithDependencyTest):
         if tx is None:
             return None
         tx_signed = cls.deployer_crypto.sign_transaction(tx)
-        cls.ledger_api.send_signed_transaction(tx_signed)
-
-        time.sleep(3)  # wait for the transaction to settle
+        tx_hash = cls.ledger_api.send_signed_transaction(tx_signed)
 
-        address, contract = cls.dependency_info["token_vault_factory"]
-        contract = cast(TokenVaultFactoryContract, contract)
+        wait_for_receipt(cls.ledger_api, tx_hash)
 
-        cls.contract_address = contract.get_vault(
+        cls.contract_address = cls.vault_factory_contract.get_vault(
             ledger_api=cls.ledger_api,
-            contract_address=address,
+            contract_address=cls.vault_factory_address,
             index=0,
         )
 
@@ -201,13 +208,8 @@ class TestTokenVault(BaseGanacheContractWithDependencyTest):
     def deploy(cls, **kwargs: Any) -> None:
         """Deploy the contract."""
 
-        is_basket = kwargs.pop("is_basket", False)
         is_token_vault = kwargs.pop("is_token_vault", False)
 
-        if is_basket:
-            cls._deploy_basket(**kwargs)
-            return
-
         if is_token_vault:
             cls._permission_vault_factory()
             cls._deploy_token_vault(**kwargs)
@@ -218,7 +220,6 @@ class TestTokenVault(BaseGanacheContractWithDependencyTest):
     def test_verify(self) -> None:
         """Test verification of deployed contract results."""
         assert self.contract_address is not None
-        settings_address, _ = self.dependency_info["token_settings"]
 
         result = self.contract.verify_contract(
             ledger_api=self.ledger_api,
@@ -227,65 +228,51 @@ class TestTokenVault(BaseGanacheContractWithDependencyTest):
 
         assert result["verified"], "The bytecode was incorrect."
 
-    def test_kick_curator(self) -> None:
-        """The owner changes the curator"""
+    def test_kick_curator_and_transfer(self) -> None:
+        """The owner changes the curator and transfers tokens, both txs are awaited together"""
 
-        new_curator = crypto_registry.make(
-            EthereumCrypto.identifier, private_key_path=ETHEREUM_KEY_PATH_1
-        )
+        # the same account becomes the new curator and receives the tokens
+        account = get_crypto(ETHEREUM_KEY_PATH_1)
 
-        raw_tx = self.contract.kick_curator(
+        kick_curator_tx = self.contract.kick_curator(
             ledger_api=self.ledger_api,
             contract_address=str(self.contract_address),
             sender_address=self.deployer_crypto.address,
-            curator_address=new_curator.address,
+            curator_address=account.address,
             gas=DEFAULT_GAS,
         )
-
-        tx_signed = self.deployer_crypto.sign_transaction(raw_tx)
-        tx_hash = self.ledger_api.send_signed_transaction(tx_signed)
-
-        assert tx_hash is not None, "Tx hash is none"
-
-        time.sleep(3)  # give 3 seconds for the transaction to go through
-
-        contract = TokenVaultContract.get_instance(
-            self.ledger_api, self.contract_address
-        )
-
-        actual_value = contract.functions.curator().call()
-        expected_value = new_curator.address
-
-        assert actual_value == expected_value, "curator was not updated"
-
-    def test_transfer(self) -> None:
-        """The owner can remove the reserve price of a user"""
-
-        receiver = crypto_registry.make(
-            EthereumCrypto.identifier, private_key_path=ETHEREUM_KEY_PATH_1
-        )
-
-        raw_tx = self.contract.transfer_erc20(
+        transfer_tx = self.contract.transfer_erc20(
             ledger_api=self.ledger_api,
             contract_address=str(self.contract_address),
             sender_address=self.deployer_crypto.address,
-            receiver_address=receiver.address,
+            receiver_address=account.address,
             amount=3,
             gas=DEFAULT_GAS,
         )
+        # both txs are built before any of them is mined, so they share the same nonce
+        transfer_tx["nonce"] = kick_curator_tx["nonce"] + 1
 
-        tx_signed = self.deployer_crypto.sign_transaction(raw_tx)
-        tx_hash = self.ledger_api.send_signed_transaction(tx_signed)
+        tx_hashes = []
+        for raw_tx in (kick_curator_tx, transfer_tx):
+            tx_signed = self.deployer_crypto.sign_transaction(raw_tx)
+            tx_hash = self.ledger_api.send_signed_transaction(tx_signed)
+            assert tx_hash is not None, "Tx hash is none"
+            tx_hashes.append(tx_hash)
 
-        assert tx_hash is not None, "Tx hash is none"
+        receipts = wait_for_receipts(self.ledger_api, tx_hashes)
 
-        time.sleep(3)  # give 3 seconds for the transaction to go through
+        assert all(receipt["status"] == 1 for receipt in receipts), "Tx failed"
 
         contract = TokenVaultContract.get_instance(
             self.ledger_api, self.contract_address
         )
 
-        actual_value = contract.functions.balanceOf(receiver.address).call()
+        actual_value = contract.functions.curator().call()
+        expected_value = account.address
+
+        assert actual_value == expected_value, "curator was not updated"
+
+        actual_value = contract.functions.balanceOf(account.address).call()
         expected_value = 3
 
         assert actual_value == expected_value, "transfer of tokens was not made"
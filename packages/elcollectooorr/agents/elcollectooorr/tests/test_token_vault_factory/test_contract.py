@@ -18,17 +18,27 @@
 # ------------------------------------------------------------------------------
 # pylint: skip-file
 """Tests for valory/token_vault_factory contract."""
-import time
+import functools
 from typing import Any, Dict, cast
 
-from aea.crypto.registries import crypto_registry
-from aea_ledger_ethereum import EthereumCrypto
 from aea_test_autonomy.base_test_classes.contracts import (
     BaseGanacheContractWithDependencyTest,
 )
 from aea_test_autonomy.configurations import ETHEREUM_KEY_PATH_1
 from aea_test_autonomy.docker.base import skip_docker_tests
+from aea_test_autonomy.helpers.contracts import get_register_contract
+from web3.contract import Contract
+from web3.types import TxReceipt
 
+from packages.elcollectooorr.agents.elcollectooorr.tests.helpers.constants import (
+    DEFAULT_GAS,
+)
+from packages.elcollectooorr.agents.elcollectooorr.tests.helpers.contracts import (
+    batch_call,
+    get_crypto,
+    wait_for_receipt,
+    wait_for_receipts,
+)
 from packages.elcollectooorr.contracts.basket.contract import BasketContract
 from packages.elcollectooorr.contracts.basket.tests import PACKAGE_DIR as BASKET_DIR
 from packages.elcollectooorr.contracts.basket_factory.contract import (
@@ -48,11 +58,6 @@ from packages.elcollectooorr.contracts.token_vault_factory.contract import (
 )
 
 
-DEFAULT_GAS = 1000000000
-DEFAULT_MAX_FEE_PER_GAS = 10 ** 10
-DEFAULT_MAX_PRIORITY_FEE_PER_GAS = 10 ** 10
-
-
 @skip_docker_tests
 class BaseTestTokenVaultFactory(BaseGanacheContractWithDependencyTest):  # pylint disable=too-few-public-methods
     """Test deployment of Token Vault Factory to Ganache."""
@@ -84,10 +89,36 @@ class BaseTestTokenVaultFactory(BaseGanacheContractWithDependencyTest):  # pylin
             _settings=settings_address,
         )
 
+    def setup_method(self) -> None:
+        """Take a snapshot of the chain, so that every test starts from the freshly deployed contracts"""
+        response = self.ledger_api.api.provider.make_request("evm_snapshot", [])
+        assert "result" in response, f"Could not take a snapshot: {response}"
+        self._snapshot_id = response["result"]
+
+    def teardown_method(self) -> None:
+        """Revert the chain to the snapshot taken before the test"""
+        response = self.ledger_api.api.provider.make_request(
+            "evm_revert", [self._snapshot_id]
+        )
+        assert response.get("result") is True, f"Could not revert the chain: {response}"
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _contract_instance(cls) -> Contract:
+        """Get the web3 instance of the deployed contract, built once per test class"""
+        return TokenVaultFactoryContract.get_instance(
+            cls.ledger_api, str(cls.contract_address)
+        )
+
+    @classmethod
+    def _wait(cls, tx_hash: str) -> TxReceipt:
+        """Wait for the transaction to be mined instead of sleeping for a fixed amount of time"""
+        return wait_for_receipt(cls.ledger_api, tx_hash)
+
 
 @skip_docker_tests
 class TestMainTokenVaultFactory(BaseTestTokenVaultFactory):
-    """Test all the functionalities - renounceOwnership"""
+    """Test all the functionalities"""
 
     def test_verify(self) -> None:
         """Test verification of deployed contract results."""
@@ -104,9 +135,7 @@ class TestMainTokenVaultFactory(BaseTestTokenVaultFactory):
     def test_pause_unpause(self) -> None:
         """Test that the owner can pause/unpause the contract"""
 
-        contract = TokenVaultFactoryContract.get_instance(
-            self.ledger_api, self.contract_address
-        )
+        contract = self._contract_instance()
 
         raw_tx = self.contract.pause(
             self.ledger_api,
@@ -119,7 +148,7 @@ class TestMainTokenVaultFactory(BaseTestTokenVaultFactory):
 
         assert tx_hash is not None, "Tx hash is none"
 
-        time.sleep(3)  # give 3 seconds for the transaction to go through
+        self._wait(tx_hash)
 
         is_paused = contract.functions.paused().call()
 
@@ -136,7 +165,7 @@ class TestMainTokenVaultFactory(BaseTestTokenVaultFactory):
 
         assert tx_hash is not None, "Tx hash is none"
 
-        time.sleep(3)  # give 3 seconds for the transaction to go through
+        self._wait(tx_hash)
 
         is_paused = contract.functions.paused().call()
 
@@ -145,12 +174,8 @@ class TestMainTokenVaultFactory(BaseTestTokenVaultFactory):
     def test_transfer_ownership(self) -> None:
         """Test that the owner can transfer the ownership"""
 
-        contract = TokenVaultFactoryContract.get_instance(
-            self.ledger_api, self.contract_address
-        )
-        new_owner = crypto_registry.make(
-            EthereumCrypto.identifier, private_key_path=ETHEREUM_KEY_PATH_1
-        )
+        contract = self._contract_instance()
+        new_owner = get_crypto(ETHEREUM_KEY_PATH_1)
 
         raw_tx = self.contract.transfer_ownership(
             self.ledger_api,
@@ -164,130 +189,43 @@ class TestMainTokenVaultFactory(BaseTestTokenVaultFactory):
 
         assert tx_hash is not None, "Tx hash is none"
 
-        time.sleep(3)  # give 3 seconds for the transaction to go through
+        self._wait(tx_hash)
 
         current_owner = contract.functions.owner().call()
 
         assert current_owner == new_owner.address, "The owner should have been changed"
 
-        # revert ownership ot the old owner so that the other tests are not affected
-        raw_tx = self.contract.transfer_ownership(
-            self.ledger_api,
-            str(self.contract_address),
-            new_owner.address,
-            self.deployer_crypto.address,
-            gas=DEFAULT_GAS,
-        )
-        tx_signed = new_owner.sign_transaction(raw_tx)
-        self.ledger_api.send_signed_transaction(tx_signed)
-
-        time.sleep(3)  # give 3 seconds for the transaction to go through
-
-    def test_get_owner(self) -> None:
-        """Test that get_owner returns the owner"""
-        contract = TokenVaultFactoryContract.get_instance(
-            self.ledger_api, self.contract_address
-        )
-
-        actual_value = self.contract.get_owner(
-            self.ledger_api,
-            str(self.contract_address),
-        )
-
-        expected_value = contract.functions.owner().call()
-
-        assert actual_value == expected_value, "wrong owner was returned"
-
-    def test_is_paused(self) -> None:
-        """Test that is_paused returns the correct value"""
-        contract = TokenVaultFactoryContract.get_instance(
-            self.ledger_api, self.contract_address
-        )
-
-        actual_value = self.contract.is_paused(
-            self.ledger_api,
-            str(self.contract_address),
-        )
-
-        expected_value = contract.functions.paused().call()
-
-        assert actual_value == expected_value, "is_paused returned the wrong value"
-
-    def test_get_logic(self) -> None:
-        """Test that get_logic returns the correct value"""
-        contract = TokenVaultFactoryContract.get_instance(
-            self.ledger_api, self.contract_address
-        )
-
-        actual_value = self.contract.get_logic(
-            self.ledger_api,
-            str(self.contract_address),
-        )
-
-        expected_value = contract.functions.logic().call()
-
-        assert actual_value == expected_value, "get_logic returned the wrong value"
-
-    def test_get_settings(self) -> None:
-        """Test that get_settings returns the correct value"""
-        contract = TokenVaultFactoryContract.get_instance(
-            self.ledger_api, self.contract_address
-        )
-
-        actual_value = self.contract.get_settings_address(
+    def test_getters(self) -> None:
+        """Test that the getters return the same values as the contract"""
+        contract = self._contract_instance()
+        getters = [
+            ("get_owner", "owner", {}),
+            ("is_paused", "paused", {}),
+            ("get_logic", "logic", {}),
+            ("get_settings_address", "settings", {}),
+            ("get_vault_count", "vaultCount", {}),
+            ("get_vault", "vaults", {"index": 0}),
+        ]
+
+        # the expected values are read in a single round trip to the node
+        expected_values = batch_call(
             self.ledger_api,
-            str(self.contract_address),
-        )
-
-        expected_value = contract.functions.settings().call()
-
-        assert (
-            actual_value == expected_value
-        ), "get_settings_address returned the wrong value"
-
-    def test_get_vault_count(self) -> None:
-        """Test that get_vault_count returns the correct value"""
-        contract = TokenVaultFactoryContract.get_instance(
-            self.ledger_api, self.contract_address
-        )
-
-        actual_value = self.contract.get_vault_count(
-            self.ledger_api,
-            str(self.contract_address),
-        )
-
-        expected_value = contract.functions.vaultCount().call()
-
-        assert (
-            actual_value == expected_value
-        ), "get_vault_count returned the wrong value"
-
-    def test_get_vault(self) -> None:
-        """Test that get_vault returns the correct value"""
-        contract = TokenVaultFactoryContract.get_instance(
-            self.ledger_api, self.contract_address
-        )
-
-        actual_value = self.contract.get_vault(
-            self.ledger_api,
-            str(self.contract_address),
-            0,
+            contract,
+            [(fn_name, list(kwargs.values())) for _, fn_name, kwargs in getters],
         )
 
-        expected_value = contract.functions.vaults(0).call()
+        for (getter, _, kwargs), expected_value in zip(getters, expected_values):
+            actual_value = getattr(self.contract, getter)(
+                self.ledger_api,
+                str(self.contract_address),
+                **kwargs,
+            )
 
-        assert actual_value == expected_value, "get_vault returned the wrong value"
-
-
-@skip_docker_tests
-class TestRenounceTokenVaultFactory(BaseTestTokenVaultFactory):
-    """Test renounce ownership"""
+            assert actual_value == expected_value, f"{getter} returned the wrong value"
 
     def test_renounce_ownership(self) -> None:
         """Test that the owner can renounce the ownership"""
-        contract = TokenVaultFactoryContract.get_instance(
-            self.ledger_api, self.contract_address
-        )
+        contract = self._contract_instance()
 
         raw_tx = self.contract.renounce_ownership(
             self.ledger_api,
@@ -300,7 +238,7 @@ class TestRenounceTokenVaultFactory(BaseTestTokenVaultFactory):
 
         assert tx_hash is not None, "Tx hash is none"
 
-        time.sleep(3)  # give 3 seconds for the transaction to go through
+        self._wait(tx_hash)
 
         current_owner = contract.functions.owner().call()
 
@@ -313,6 +251,8 @@ class TestRenounceTokenVaultFactory(BaseTestTokenVaultFactory):
 class TestMintTokenVault(BaseTestTokenVaultFactory):
     """Test minting a new token vault"""
 
+    basket_address: str
+
     dependencies = BaseTestTokenVaultFactory.dependencies + [
         (
             "basket_factory",
@@ -321,27 +261,23 @@ class TestMintTokenVault(BaseTestTokenVaultFactory):
                 gas=DEFAULT_GAS,
             ),
         ),
-        (
-            "basket",
-            BASKET_DIR,
-            dict(
-                gas=DEFAULT_GAS,
-                is_basket=True,
-            ),
-        ),
     ]
 
+    @classmethod
+    def deployment_kwargs(cls) -> Dict[str, Any]:
+        """Get deployment kwargs."""
+        return dict(super().deployment_kwargs(), with_basket=True)
+
     @classmethod
     def _setup_class(cls, **kwargs: Any) -> None:  # pylint: disable=inconsistent-return-statements
         """Setup class, approve token vault to use the basket"""
 
         super()._setup_class(**kwargs)
 
-        basket_address, basket_contract = cls.dependency_info["basket"]
-        basket_contract = cast(BasketContract, basket_contract)
+        basket_contract = cast(BasketContract, get_register_contract(BASKET_DIR))
         raw_tx = basket_contract.set_approve_for_all(
             ledger_api=cls.ledger_api,
-            contract_address=basket_address,
+            contract_address=cls.basket_address,
             sender_address=cls.deployer_crypto.address,
             operator_address=str(cls.contract_address),
             is_approved=True,
@@ -352,56 +288,73 @@ class TestMintTokenVault(BaseTestTokenVaultFactory):
         tx_signed = cls.deployer_crypto.sign_transaction(raw_tx)
         tx_hash = cls.ledger_api.send_signed_transaction(tx_signed)
 
-        time.sleep(3)  # wait for the transaction to settle
+        cls._wait(tx_hash)
 
         assert tx_hash is not None, "Tx hash is none"
 
     @classmethod
     def deploy(cls, **kwargs: Any) -> None:  # pylint: disable=inconsistent-return-statements
-        """Deploy the contract."""
+        """Deploy the contract, the basket is created in the same batch of txs as the token vault factory."""
 
-        is_basket = kwargs.pop("is_basket", False)
+        with_basket = kwargs.pop("with_basket", False)
 
-        if not is_basket:
+        if not with_basket:
             super().deploy(**kwargs)
             return
 
         basket_factory_address, _ = cls.dependency_info["basket_factory"]
 
-        tx = cls.contract.get_deploy_transaction(
+        create_basket_tx = BasketFactoryContract.create_basket(
+            ledger_api=cls.ledger_api,
+            factory_contract_address=basket_factory_address,
+            deployer_address=str(cls.deployer_crypto.address),
+            gas=DEFAULT_GAS,
+        )
+        deploy_tx = cls.contract.get_deploy_transaction(
             ledger_api=cls.ledger_api,
             deployer_address=str(cls.deployer_crypto.address),
-            basket_factory_address=basket_factory_address,
             **kwargs,
         )
-        if tx is None:
+        if deploy_tx is None:
             return None
-        tx_signed = cls.deployer_crypto.sign_transaction(tx)
-        tx_hash = cls.ledger_api.send_signed_transaction(tx_signed)
-
-        time.sleep(3)  # wait for the transaction to settle
+        # both txs are sent by the deployer before any of them is mined, so the nonces are set explicitly
+        deploy_tx["nonce"] = create_basket_tx["nonce"] + 1
+
+        tx_hashes = [
+            cls.ledger_api.send_signed_transaction(
+                cls.deployer_crypto.sign_transaction(tx)
+            )
+            for tx in (create_basket_tx, deploy_tx)
+        ]
+        create_basket_receipt, deploy_receipt = wait_for_receipts(
+            cls.ledger_api, tx_hashes
+        )
+        assert create_basket_receipt["status"] == 1, "Basket creation failed"
+        assert deploy_receipt["status"] == 1, "Token vault factory deployment failed"
+        assert (
+            deploy_receipt["contractAddress"] is not None
+        ), "Token vault factory not deployed"
+        cls.contract_address = str(deploy_receipt["contractAddress"])
 
         basket_info = cast(
             Dict,
             BasketFactoryContract.get_basket_address(
                 cls.ledger_api,
                 basket_factory_address,
-                str(tx_hash),
+                str(tx_hashes[0]),
             ),
         )
-        cls.contract_address = str(basket_info["basket_address"])
+        cls.basket_address = str(basket_info["basket_address"])
 
     def test_mint(self) -> None:
         """Test minting a new token vault."""
-        basket_address, _ = self.dependency_info["basket"]
-
         raw_tx = self.contract.mint(
             ledger_api=self.ledger_api,
             contract_address=str(self.contract_address),
             sender_address=self.deployer_crypto.address,
             name="test_name",
             symbol="TST",
-            token_address=basket_address,
+            token_address=self.basket_address,
             token_id=0,
             token_supply=3,
             list_price=1,
@@ -414,7 +367,7 @@ class TestMintTokenVault(BaseTestTokenVaultFactory):
 
         assert tx_hash is not None, "Tx hash is none"
 
-        time.sleep(3)  # give 3 seconds for the transaction to go through
+        self._wait(tx_hash)
 
         vault_address = self.contract.get_vault(
             ledger_api=self.ledger_api,
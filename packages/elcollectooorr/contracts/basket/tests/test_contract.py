@@ -18,14 +18,17 @@
 # ------------------------------------------------------------------------------
 # pylint: skip-file
 """Tests for valory/basket contract."""
-import time
 from pathlib import Path
 from typing import Any, Dict, Optional, cast
 
+from aea.crypto.base import LedgerApi
+from aea_ledger_ethereum import EthereumApi
 from aea_test_autonomy.base_test_classes.contracts import (
     BaseGanacheContractWithDependencyTest,
 )
 from aea_test_autonomy.docker.base import skip_docker_tests
+from eth_typing import HexStr
+from web3.types import TxReceipt
 
 from packages.elcollectooorr.contracts.basket.contract import BasketContract
 from packages.elcollectooorr.contracts.basket_factory.contract import (
@@ -36,6 +39,15 @@ from packages.elcollectooorr.contracts.basket_factory.contract import (
 DEFAULT_GAS = 10000000
 DEFAULT_MAX_FEE_PER_GAS = 10 ** 10
 DEFAULT_MAX_PRIORITY_FEE_PER_GAS = 10 ** 10
+RECEIPT_TIMEOUT = 10.0
+RECEIPT_POLL_LATENCY = 0.1
+
+
+def _wait_for_receipt(ledger_api: LedgerApi, tx_hash: str) -> TxReceipt:
+    """Wait for a transaction to be mined and return its receipt."""
+    return cast(EthereumApi, ledger_api).api.eth.wait_for_transaction_receipt(
+        HexStr(tx_hash), timeout=RECEIPT_TIMEOUT, poll_latency=RECEIPT_POLL_LATENCY
+    )
 
 
 @skip_docker_tests
@@ -78,7 +90,7 @@ class TestBasket(BaseGanacheContractWithDependencyTest):
         tx_signed = cls.deployer_crypto.sign_transaction(tx)
         tx_hash = cls.ledger_api.send_signed_transaction(tx_signed)
 
-        time.sleep(3)  # wait for the transaction to settle
+        _wait_for_receipt(cls.ledger_api, tx_hash)
 
         cls.contract_address = (
             "0x"  # to avoid failing test because of missing contract address
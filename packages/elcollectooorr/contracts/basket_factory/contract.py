@@ -19,13 +19,14 @@
 
 """This module contains the class to connect to a Fractional Basket Factory contract."""
 import logging
-from typing import Any, Optional, cast
+from typing import Any, List, Optional, cast
 
 from aea.common import JSONLike
 from aea.configurations.base import PublicId
 from aea.contracts.base import Contract
 from aea.crypto.base import LedgerApi
 from aea_ledger_ethereum import EthereumApi
+from web3 import Web3
 from web3.types import BlockIdentifier, Nonce, TxParams, Wei
 
 
@@ -40,6 +41,7 @@ class BasketFactoryContract(Contract):
     """The Basket Factory contract."""
 
     contract_id = PUBLIC_ID
+    _local_code_hash: Optional[bytes] = None
 
     @classmethod
     def get_raw_transaction(
@@ -149,11 +151,18 @@ class BasketFactoryContract(Contract):
         """
         ledger_api = cast(EthereumApi, ledger_api)
         contract_address = ledger_api.api.to_checksum_address(contract_address)
-        deployed_bytecode = ledger_api.api.eth.get_code(contract_address).hex()
-        local_bytecode = cls.contract_interface["ethereum"]["deployedBytecode"]
-        verified = deployed_bytecode == local_bytecode
+        deployed_bytecode = ledger_api.api.eth.get_code(contract_address)
+        verified = Web3.keccak(deployed_bytecode) == cls._get_local_code_hash()
         return dict(verified=verified)
 
+    @classmethod
+    def _get_local_code_hash(cls) -> bytes:
+        """Get the keccak256 hash of the deployed bytecode in the artifact, computed once."""
+        if cls._local_code_hash is None:
+            local_bytecode = cls.contract_interface["ethereum"]["deployedBytecode"]
+            cls._local_code_hash = Web3.keccak(hexstr=local_bytecode)
+        return cls._local_code_hash
+
     @classmethod
     def get_basket_address(
         cls, ledger_api: LedgerApi, contract_address: str, tx_hash: str
@@ -185,6 +194,52 @@ class BasketFactoryContract(Contract):
 
         return response
 
+    @classmethod
+    def get_basket_addresses(
+        cls,
+        ledger_api: LedgerApi,
+        contract_address: str,
+        tx_hashes: List[str],
+        from_block: BlockIdentifier,
+        to_block: BlockIdentifier = "latest",
+    ) -> JSONLike:
+        """
+        Get the baskets created by several "createBasket" transactions, with a single logs query.
+
+        :param ledger_api: the ledger API object
+        :param contract_address: the address of the factory contract
+        :param tx_hashes: tx hashes of "createBasket"
+        :param from_block: from which block to search for events, e.g. the block of the earliest tx
+        :param to_block: to which block to search for events
+        :return: the basket contract address and the address of the creator, by the tx hashes as given
+        """
+        ledger_api = cast(EthereumApi, ledger_api)
+        contract_address = ledger_api.api.to_checksum_address(contract_address)
+        factory_contract = cls.get_instance(ledger_api, contract_address)
+        entries = factory_contract.events.NewBasket.get_logs(
+            fromBlock=from_block,
+            toBlock=to_block,
+        )
+
+        # the logs report the tx hashes in lowercase hex, whereas the result is keyed by the hashes as given
+        requested = {
+            ledger_api.api.to_hex(hexstr=tx_hash): tx_hash for tx_hash in tx_hashes
+        }
+        baskets = {}
+        for entry in entries:  # in case of multiple logs in a tx, the last one is kept
+            tx_hash = ledger_api.api.to_hex(entry["transactionHash"])
+            if tx_hash in requested:
+                baskets[requested[tx_hash]] = {
+                    "basket_address": entry["args"]["_address"],
+                    "creator_address": entry["args"]["_creator"],
+                }
+
+        missing = set(tx_hashes) - baskets.keys()
+        if len(missing) > 0:
+            _logger.error(f"No 'NewBasket' events were emitted in the txs={missing}")
+
+        return baskets
+
     @classmethod
     def create_basket_abi(
         cls,
@@ -19,15 +19,24 @@
 # pylint: skip-file
 
 """Tests for valory/basket_factory contract."""
-import time
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, cast
 
+from aea.crypto.base import LedgerApi
 from aea.crypto.registries import crypto_registry
-from aea_ledger_ethereum import EthereumCrypto
+from aea_ledger_ethereum import EthereumApi, EthereumCrypto
 from aea_test_autonomy.base_test_classes.contracts import BaseGanacheContractTest
-from aea_test_autonomy.configurations import ETHEREUM_KEY_PATH_1
+from aea_test_autonomy.configurations import (
+    ETHEREUM_KEY_PATH_1,
+    ETHEREUM_KEY_PATH_2,
+    ETHEREUM_KEY_PATH_3,
+    ETHEREUM_KEY_PATH_4,
+)
 from aea_test_autonomy.docker.base import skip_docker_tests
+from eth_typing import HexStr
+from web3.types import TxReceipt
 
 from packages.elcollectooorr.contracts.basket_factory.contract import (
     BasketFactoryContract,
@@ -37,6 +46,35 @@ from packages.elcollectooorr.contracts.basket_factory.contract import (
 DEFAULT_GAS = 10000000
 DEFAULT_MAX_FEE_PER_GAS = 10 ** 10
 DEFAULT_MAX_PRIORITY_FEE_PER_GAS = 10 ** 10
+RECEIPT_TIMEOUT = 10.0
+RECEIPT_POLL_LATENCY = 0.05
+REQUIRED_TX_KEYS = frozenset(
+    {
+        "value",
+        "chainId",
+        "maxFeePerGas",
+        "maxPriorityFeePerGas",
+        "gas",
+        "nonce",
+        "to",
+        "data",
+    }
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _crypto(private_key_path: str) -> EthereumCrypto:
+    """Get the crypto object of a private key, loading the key file only once."""
+    return crypto_registry.make(
+        EthereumCrypto.identifier, private_key_path=private_key_path
+    )
+
+
+def _wait_for_receipt(ledger_api: LedgerApi, tx_hash: str) -> TxReceipt:
+    """Wait for a transaction to be mined and return its receipt."""
+    return cast(EthereumApi, ledger_api).api.eth.wait_for_transaction_receipt(
+        HexStr(tx_hash), timeout=RECEIPT_TIMEOUT, poll_latency=RECEIPT_POLL_LATENCY
+    )
 
 
 @skip_docker_tests
@@ -48,6 +86,13 @@ class TestBasketFactory(BaseGanacheContractTest):
         CONTRACTS_DIR, "basket_factory"
     )
     contract: BasketFactoryContract
+    _contract_address_str: str
+
+    @classmethod
+    def _setup_class(cls, **kwargs: Any) -> None:
+        """Setup test."""
+        super()._setup_class(**kwargs)
+        cls._contract_address_str = str(cls.contract_address)
 
     @classmethod
     def deployment_kwargs(cls) -> Dict[str, Any]:
@@ -58,42 +103,30 @@ class TestBasketFactory(BaseGanacheContractTest):
 
     def test_create_basket(self) -> None:
         """Test creating a basket"""
-        sender = crypto_registry.make(
-            EthereumCrypto.identifier, private_key_path=ETHEREUM_KEY_PATH_1
-        )
+        sender = _crypto(ETHEREUM_KEY_PATH_1)
 
         tx = self.contract.create_basket(
             ledger_api=self.ledger_api,
-            factory_contract_address=str(self.contract_address),
+            factory_contract_address=self._contract_address_str,
             deployer_address=sender.address,
             gas=DEFAULT_GAS,
+            max_fee_per_gas=DEFAULT_MAX_FEE_PER_GAS,
+            max_priority_fee_per_gas=DEFAULT_MAX_PRIORITY_FEE_PER_GAS,
         )
 
-        assert all(
-            [
-                key in tx.keys()
-                for key in [
-                    "value",
-                    "chainId",
-                    "maxFeePerGas",
-                    "maxPriorityFeePerGas",
-                    "gas",
-                    "nonce",
-                    "to",
-                    "data",
-                ]
-            ]
-        ), "Missing key"
+        assert REQUIRED_TX_KEYS.issubset(
+            tx
+        ), f"Missing tx keys: {set(REQUIRED_TX_KEYS - tx.keys())}"
 
         tx_signed = sender.sign_transaction(tx)
         tx_hash = self.ledger_api.send_signed_transaction(tx_signed)
 
         assert tx_hash is not None, "Tx hash not none"
 
-        time.sleep(3)  # give 3 seconds for the transaction to go through
+        _wait_for_receipt(self.ledger_api, tx_hash)
 
         basket_info = self.contract.get_basket_address(
-            self.ledger_api, str(self.contract_address), tx_hash
+            self.ledger_api, self._contract_address_str, tx_hash
         )
 
         assert basket_info is not None, "couldn't get the basket data"
@@ -107,6 +140,59 @@ class TestBasketFactory(BaseGanacheContractTest):
             basket_info["creator_address"] == sender.address
         ), "creator_address doesnt match signer"
 
+    def test_create_basket_batch(self) -> None:
+        """Test creating several baskets at once, each from a different sender"""
+        senders = [
+            _crypto(path)
+            for path in (
+                ETHEREUM_KEY_PATH_1,
+                ETHEREUM_KEY_PATH_2,
+                ETHEREUM_KEY_PATH_3,
+                ETHEREUM_KEY_PATH_4,
+            )
+        ]
+
+        def sign_create_basket(sender: EthereumCrypto) -> Any:
+            """Build and sign the tx that creates a basket"""
+            tx = self.contract.create_basket(
+                ledger_api=self.ledger_api,
+                factory_contract_address=self._contract_address_str,
+                deployer_address=sender.address,
+                gas=DEFAULT_GAS,
+                max_fee_per_gas=DEFAULT_MAX_FEE_PER_GAS,
+                max_priority_fee_per_gas=DEFAULT_MAX_PRIORITY_FEE_PER_GAS,
+            )
+            return sender.sign_transaction(tx)
+
+        def send(tx_signed: Any) -> str:
+            """Send a signed tx"""
+            tx_hash = self.ledger_api.send_signed_transaction(tx_signed)
+            assert tx_hash is not None, "Tx hash not none"
+            return tx_hash
+
+        # every sender has its own nonce, so the txs can be sent concurrently and mined together,
+        # all of them are signed beforehand so that sending them is only bound by the network
+        with ThreadPoolExecutor(max_workers=len(senders)) as executor:
+            txs_signed = list(executor.map(sign_create_basket, senders))
+            tx_hashes = list(executor.map(send, txs_signed))
+            wait = functools.partial(_wait_for_receipt, self.ledger_api)
+            receipts = list(executor.map(wait, tx_hashes))
+
+        baskets = self.contract.get_basket_addresses(
+            self.ledger_api,
+            self._contract_address_str,
+            tx_hashes,
+            from_block=min(receipt["blockNumber"] for receipt in receipts),
+        )
+
+        for sender, tx_hash in zip(senders, tx_hashes):
+            basket_info = baskets.get(tx_hash)
+
+            assert basket_info is not None, "couldn't get the basket data"
+            assert (
+                basket_info["creator_address"] == sender.address
+            ), "creator_address doesnt match signer"
+
     def test_verify(self) -> None:
         """Test verification of deployed contract results."""
         assert self.contract_address is not None
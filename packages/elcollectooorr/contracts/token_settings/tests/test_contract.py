@@ -19,15 +19,18 @@
 # pylint: skip-file
 
 """Tests for valory/token_settings contract."""
-import time
+import functools
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, cast
 
+from aea.crypto.base import LedgerApi
 from aea.crypto.registries import crypto_registry
-from aea_ledger_ethereum import EthereumCrypto
+from aea_ledger_ethereum import EthereumApi, EthereumCrypto
 from aea_test_autonomy.base_test_classes.contracts import BaseGanacheContractTest
 from aea_test_autonomy.configurations import ETHEREUM_KEY_PATH_2
 from aea_test_autonomy.docker.base import skip_docker_tests
+from eth_typing import HexStr
+from web3.types import TxReceipt
 
 from packages.elcollectooorr.contracts.token_settings.contract import (
     TokenSettingsContract,
@@ -37,6 +40,23 @@ from packages.elcollectooorr.contracts.token_settings.contract import (
 DEFAULT_GAS = 10000000
 DEFAULT_MAX_FEE_PER_GAS = 10 ** 10
 DEFAULT_MAX_PRIORITY_FEE_PER_GAS = 10 ** 10
+RECEIPT_TIMEOUT = 10.0
+RECEIPT_POLL_LATENCY = 0.1
+
+
+@functools.lru_cache(maxsize=None)
+def _crypto(private_key_path: str) -> EthereumCrypto:
+    """Get the crypto object of a private key, loading the key file only once."""
+    return crypto_registry.make(
+        EthereumCrypto.identifier, private_key_path=private_key_path
+    )
+
+
+def _wait_for_receipt(ledger_api: LedgerApi, tx_hash: str) -> TxReceipt:
+    """Wait for a transaction to be mined and return its receipt."""
+    return cast(EthereumApi, ledger_api).api.eth.wait_for_transaction_receipt(
+        HexStr(tx_hash), timeout=RECEIPT_TIMEOUT, poll_latency=RECEIPT_POLL_LATENCY
+    )
 
 
 @skip_docker_tests
@@ -60,9 +80,7 @@ class TestTokenSettingsFactory(BaseGanacheContractTest):
         """Test fee_reciever change then test ownership change"""
 
         # test changing fee receiver
-        new_receiver = crypto_registry.make(
-            EthereumCrypto.identifier, private_key_path=ETHEREUM_KEY_PATH_2
-        )
+        new_receiver = _crypto(ETHEREUM_KEY_PATH_2)
 
         tx = self.contract.set_fee_receiver(
             ledger_api=self.ledger_api,
@@ -77,7 +95,7 @@ class TestTokenSettingsFactory(BaseGanacheContractTest):
 
         assert tx_hash is not None, "Tx hash is none"
 
-        time.sleep(3)  # give 3 seconds for the transaction to go through
+        _wait_for_receipt(self.ledger_api, tx_hash)
 
         contract = TokenSettingsContract.get_instance(
             self.ledger_api, contract_address=self.contract_address
@@ -89,9 +107,7 @@ class TestTokenSettingsFactory(BaseGanacheContractTest):
         ), f"Expected the fee receiver to be: {new_receiver.address}"
 
         # test changing owner
-        new_owner = crypto_registry.make(
-            EthereumCrypto.identifier, private_key_path=ETHEREUM_KEY_PATH_2
-        )
+        new_owner = _crypto(ETHEREUM_KEY_PATH_2)
 
         tx = self.contract.transfer_ownership(
             ledger_api=self.ledger_api,
@@ -106,7 +122,7 @@ class TestTokenSettingsFactory(BaseGanacheContractTest):
 
         assert tx_hash is not None, "Tx hash is none"
 
-        time.sleep(3)  # give 3 seconds for the transaction to go through
+        _wait_for_receipt(self.ledger_api, tx_hash)
 
         contract = TokenSettingsContract.get_instance(
             self.ledger_api, contract_address=self.contract_address
@@ -119,9 +135,7 @@ class TestTokenSettingsFactory(BaseGanacheContractTest):
 
     def test_verify(self) -> None:
         """Test verification of deployed contract results."""
-        new_receiver = crypto_registry.make(
-            EthereumCrypto.identifier, private_key_path=ETHEREUM_KEY_PATH_2
-        )
+        new_receiver = _crypto(ETHEREUM_KEY_PATH_2)
 
         assert self.contract_address is not None
         result = self.contract.verify_contract(